@@ -1,10 +1,16 @@
 """Configuration management for MCP persistent shell server."""
 
 import os
-from pathlib import Path
 from typing import Any
 
 import yaml
+
+try:
+    # libyaml-backed loader; ~5-20x faster than the pure-Python SafeLoader
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -12,6 +18,8 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class SecurityConfig(BaseSettings):
     """Security configuration."""
 
+    model_config = SettingsConfigDict(frozen=True)
+
     enabled: bool = Field(default=False, description="Enable security validation")
     allowed_executables: list[str] = Field(
         default_factory=list,
@@ -50,6 +58,8 @@ class SecurityConfig(BaseSettings):
 class SessionConfig(BaseSettings):
     """Session management configuration."""
 
+    model_config = SettingsConfigDict(frozen=True)
+
     timeout: int = Field(
         default=3600,
         ge=60,
@@ -70,6 +80,8 @@ class SessionConfig(BaseSettings):
 class ServerConfig(BaseSettings):
     """HTTP server configuration."""
 
+    model_config = SettingsConfigDict(frozen=True)
+
     name: str = Field(
         default="mcp-persistent-shell",
         description="Server name",
@@ -93,6 +105,8 @@ class ServerConfig(BaseSettings):
 class LoggingConfig(BaseSettings):
     """Logging configuration."""
 
+    model_config = SettingsConfigDict(frozen=True)
+
     level: str = Field(
         default="info",
         description="Log level (debug, info, warning, error, critical)",
@@ -106,6 +120,8 @@ class LoggingConfig(BaseSettings):
 class ShellConfig(BaseSettings):
     """Shell process configuration."""
 
+    model_config = SettingsConfigDict(frozen=True)
+
     default_shell: str = Field(
         default="/bin/bash",
         description="Default shell to use",
@@ -114,6 +130,10 @@ class ShellConfig(BaseSettings):
         default="__MCP_SHELL_PROMPT__",
         description="Custom prompt marker for detection",
     )
+    scrollback_size: int = Field(
+        default=1048576,
+        description="Bytes of recent shell output retained for replay (0 disables)",
+    )
 
 
 class Config(BaseSettings):
@@ -123,6 +143,7 @@ class Config(BaseSettings):
         env_prefix="MCP_SHELL_",
         env_nested_delimiter="__",
         case_sensitive=False,
+        frozen=True,
     )
 
     security: SecurityConfig = Field(default_factory=SecurityConfig)
@@ -136,29 +157,24 @@ class Config(BaseSettings):
     @classmethod
     def load(cls) -> "Config":
         """Load configuration from environment and optional YAML file."""
-        # Load base config from environment variables
-        config = cls()
-
-        # If config file is specified, overlay YAML values
-        config_file_path = os.environ.get("MCP_SHELL_CONFIG_FILE", config.config_file)
-        if config_file_path and Path(config_file_path).exists():
-            with open(config_file_path, "r") as f:
-                yaml_data = yaml.safe_load(f)
-
-            if yaml_data:
-                # Update config with YAML values
-                if "security" in yaml_data:
-                    config.security = SecurityConfig(**yaml_data["security"])
-                if "session" in yaml_data:
-                    config.session = SessionConfig(**yaml_data["session"])
-                if "server" in yaml_data:
-                    config.server = ServerConfig(**yaml_data["server"])
-                if "logging" in yaml_data:
-                    config.logging = LoggingConfig(**yaml_data["logging"])
-                if "shell" in yaml_data:
-                    config.shell = ShellConfig(**yaml_data["shell"])
-
-        return config
+        # Read the optional YAML overlay first. A single stat() both checks
+        # existence and avoids the Path object round-trip.
+        yaml_data: dict[str, Any] = {}
+        config_file_path = os.environ.get("MCP_SHELL_CONFIG_FILE", "")
+        if config_file_path:
+            try:
+                os.stat(config_file_path)
+            except FileNotFoundError:
+                pass
+            else:
+                with open(config_file_path, "r") as f:
+                    yaml_data = yaml.load(f, Loader=_YamlLoader) or {}
+
+        # Single construction: pydantic-settings deep-merges init kwargs with
+        # env vars per field, so YAML values take precedence where present and
+        # env vars still fill in the fields YAML doesn't mention. This runs
+        # validation once instead of once for env plus once per YAML section.
+        return cls(**yaml_data)
 
     def warn_if_insecure(self) -> None:
         """Print warnings if security is disabled."""
@@ -1,9 +1,9 @@
 """Data models for MCP persistent shell server."""
 
 from enum import Enum
-from typing import Literal
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class CommandResult(BaseModel):
@@ -18,6 +18,16 @@ class CommandResult(BaseModel):
     security_info: dict[str, bool | str] | None = None
 
 
+# Dumping through a prebuilt adapter skips the per-call field-definition
+# walk of model_dump() on the hottest result type in the server
+_CR_ADAPTER: TypeAdapter[CommandResult] = TypeAdapter(CommandResult)
+
+
+def dump_command_result(result: CommandResult) -> dict[str, Any]:
+    """Serialize a CommandResult to a plain dict (hot path)."""
+    return _CR_ADAPTER.dump_python(result)
+
+
 class FileUploadRequest(BaseModel):
     """Request to upload a file to the workspace."""
 
@@ -2,7 +2,7 @@
 
 import logging
 import re
-from typing import List
+from typing import Callable, List
 
 from mcp_persistent_shell.config import SecurityConfig
 
@@ -14,51 +14,124 @@ class SecurityValidator:
         self.config = config
         self.logger = logger or logging.getLogger(__name__)
         self._compiled_patterns = [re.compile(p) for p in config.blocked_patterns]
+        # Combine all blocked patterns into one alternation so the common case
+        # (no match) is a single C-level scan over the command instead of one
+        # scan per pattern — the stdlib equivalent of a multi-pattern matcher
+        # (Aho-Corasick/Hyperscan) without adding a native dependency. The
+        # per-pattern list is only walked on a hit, to identify which pattern
+        # matched for the error and audit log.
+        self._combined_pattern = (
+            re.compile("|".join(f"(?:{p})" for p in config.blocked_patterns))
+            if config.blocked_patterns
+            else None
+        )
+        # Precompute allowlist lookups: frozenset for O(1) membership, joined
+        # string for the error message.
+        self._allowed_set: frozenset[str] = frozenset(config.allowed_executables)
+        self._allowed_str = ", ".join(config.allowed_executables)
+        # Plain bool attributes; avoid the config attribute chain per call
+        self._audit = bool(config.audit_log)
+        self._enabled = bool(config.enabled)
+
+        # Bind the narrowest implementation for this config shape so the hot
+        # path doesn't re-test branches whose outcome is fixed at construction
+        self.validate_command: Callable[[str], None]
+        if not self._enabled:
+            self.validate_command = self._validate_disabled
+        elif self._allowed_set and self._combined_pattern:
+            self.validate_command = self._validate_both
+        elif self._allowed_set:
+            self.validate_command = self._validate_allow_only
+        elif self._combined_pattern:
+            self.validate_command = self._validate_block_only
+        else:
+            self.validate_command = self._validate_audit_only
 
     def is_enabled(self) -> bool:
         """Check if security validation is enabled."""
-        return self.config.enabled
+        return self._enabled
 
-    def validate_command(self, command: str) -> None:
-        """Validate command against security policies. Raises ValueError if invalid."""
-        if not self.config.enabled:
-            return
+    # --- specialized validate_command implementations ---
+
+    def _validate_disabled(self, command: str) -> None:
+        """Security disabled: accept everything."""
+
+    def _validate_audit_only(self, command: str) -> None:
+        """No allowlist or blocklist configured: just normalize and audit."""
+        command = self._prepare(command)
+        self._audit_success(command)
+
+    def _validate_allow_only(self, command: str) -> None:
+        """Only an allowlist is configured."""
+        command = self._prepare(command)
+        self._check_allowlist(command)
+        self._audit_success(command)
+
+    def _validate_block_only(self, command: str) -> None:
+        """Only blocked patterns are configured."""
+        command = self._prepare(command)
+        self._check_blocklist(command)
+        self._audit_success(command)
 
+    def _validate_both(self, command: str) -> None:
+        """Allowlist and blocked patterns are both configured."""
+        command = self._prepare(command)
+        self._check_allowlist(command)
+        self._check_blocklist(command)
+        self._audit_success(command)
+
+    # --- shared pieces ---
+
+    @staticmethod
+    def _prepare(command: str) -> str:
+        """Strip the command and reject empty input."""
         command = command.strip()
         if not command:
             raise ValueError("Empty command")
+        return command
 
-        # Extract executable (first token)
-        executable = command.split()[0] if command else ""
-
-        # Check allowlist (if configured)
-        if self.config.allowed_executables:
-            if executable not in self.config.allowed_executables:
-                if self.config.audit_log:
-                    self.logger.warning(
-                        f"Blocked command (not in allowlist): {command}",
-                        extra={"audit": True, "command": command},
-                    )
-                raise ValueError(
-                    f"Command '{executable}' is not in the allowlist. "
-                    f"Allowed: {', '.join(self.config.allowed_executables)}"
+    def _check_allowlist(self, command: str) -> None:
+        """Raise if the command's executable is not in the allowlist."""
+        # Extract executable (first token) without tokenizing the whole
+        # command line
+        executable = command.split(maxsplit=1)[0]
+        if executable not in self._allowed_set:
+            if self._audit and self.logger.isEnabledFor(logging.WARNING):
+                self.logger.warning(
+                    "Blocked command (not in allowlist): %s",
+                    command,
+                    extra={"audit": True, "command": command},
                 )
+            raise ValueError(
+                f"Command '{executable}' is not in the allowlist. "
+                f"Allowed: {self._allowed_str}"
+            )
 
-        # Check blocklist patterns
+    def _check_blocklist(self, command: str) -> None:
+        """Raise if the command matches any blocked pattern."""
+        # Single combined scan; walk the individual patterns only when
+        # something matched
+        if not self._combined_pattern.search(command):  # type: ignore[union-attr]
+            return
         for pattern in self._compiled_patterns:
-            if pattern.search(command):
-                if self.config.audit_log:
-                    self.logger.warning(
-                        f"Blocked command (matches pattern): {command}",
-                        extra={"audit": True, "command": command, "pattern": pattern.pattern},
-                    )
-                raise ValueError(
-                    f"Command matches blocked pattern: {pattern.pattern}"
+            if not pattern.search(command):
+                continue
+            if self._audit and self.logger.isEnabledFor(logging.WARNING):
+                self.logger.warning(
+                    "Blocked command (matches pattern): %s",
+                    command,
+                    extra={"audit": True, "command": command, "pattern": pattern.pattern},
                 )
+            raise ValueError(
+                f"Command matches blocked pattern: {pattern.pattern}"
+            )
 
-        # Audit log successful validation
-        if self.config.audit_log:
+    def _audit_success(self, command: str) -> None:
+        """Audit log successful validation (skip the extra-dict allocation
+        when the record would be dropped anyway)."""
+        if self._audit and self.logger.isEnabledFor(logging.INFO):
             self.logger.info(
-                f"Command validated: {command}",
+                "Command validated: %s",
+                command,
                 extra={"audit": True, "command": command},
             )
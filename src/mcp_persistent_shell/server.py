@@ -1,18 +1,23 @@
 """FastAPI server with MCP Streamable HTTP transport."""
 
+import asyncio
+import base64
 import logging
+import os
+import time
 from contextlib import asynccontextmanager
 from typing import Any
 
 from fastapi import FastAPI, Header, HTTPException
+from fastapi.responses import ORJSONResponse
 from mcp.server import FastMCP
 from mcp.server.transport_security import TransportSecuritySettings
-
 from mcp_persistent_shell.config import Config
+from mcp_persistent_shell.models import dump_command_result
 from mcp_persistent_shell.security.validator import SecurityValidator
 from mcp_persistent_shell.session.manager import SessionManager
 from mcp_persistent_shell.shell.process import ShellProcess
-from mcp_persistent_shell.tools.execute_command import handle_execute_command
+from mcp_persistent_shell.tools.execute_command import ERR_TEMPLATE, handle_execute_command
 from mcp_persistent_shell.tools.get_cwd import handle_get_cwd
 from mcp_persistent_shell.tools.reset_session import handle_reset_session
 from mcp_persistent_shell.tools.upload_file import handle_upload_file
@@ -28,6 +33,10 @@ logger: logging.Logger
 mcp: FastMCP
 global_shell: ShellProcess | None = None  # Single shared shell session for MVP
 
+# Directories we've already created (or confirmed) for uploads; skips the
+# mkdir/stat syscalls when uploads repeatedly target the same directory
+_known_dirs: set[str] = set()
+
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
@@ -61,9 +70,17 @@ def create_app() -> FastAPI:
         transport_security=transport_security,
     )
 
+    # is_alive() is just a returncode read, but remember when we last saw the
+    # shell healthy so back-to-back tool calls skip the restart branch entirely
+    last_alive_check = 0.0
+
     async def ensure_shell() -> ShellProcess:
         """Ensure global shell is created and return it."""
         global global_shell
+        nonlocal last_alive_check
+        now = time.monotonic()
+        if global_shell is not None and now - last_alive_check < 1.0:
+            return global_shell
         if global_shell is None or not global_shell.is_alive():
             global_shell = ShellProcess(
                 shell_config=config.shell,
@@ -72,8 +89,14 @@ def create_app() -> FastAPI:
             )
             await global_shell.start()
             logger.info("Global shell session initialized")
+        last_alive_check = now
         return global_shell
 
+    # Bind the hot-path callables once so the tool closures hit them via
+    # fast cell loads instead of a module-global plus attribute lookup per RPC
+    _validate_command = security_validator.validate_command
+    _log_info = logger.info
+
     # Register tools
     @mcp.tool()
     async def execute_command(command: str, timeout: int = 30) -> dict[str, Any]:
@@ -85,30 +108,64 @@ def create_app() -> FastAPI:
             command: The shell command to execute
             timeout: Timeout in seconds (default: 30)
         """
-        logger.info(f"execute_command called with: command={command!r}, timeout={timeout}")
+        _log_info("execute_command called with: command=%r, timeout=%s", command, timeout)
 
         # Validate command security
         try:
-            security_validator.validate_command(command)
+            _validate_command(command)
         except ValueError as e:
-            logger.warning(f"Command validation failed: {e}")
+            logger.warning("Command validation failed: %s", e)
             return {
-                "status": "error",
-                "exit_code": -1,
-                "stdout": "",
+                **ERR_TEMPLATE,
                 "stderr": f"Security validation failed: {str(e)}",
                 "command": command,
-                "execution_time": 0.0,
             }
 
         # Get or create global shell
         shell = await ensure_shell()
-        logger.debug(f"Shell alive: {shell.is_alive()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Shell alive: %s", shell.is_alive())
 
         # Execute command
         result = await shell.execute(command, timeout=timeout)
-        logger.info(f"Command result: status={result.status}, exit_code={result.exit_code}, stdout_len={len(result.stdout)}")
-        return result.model_dump()
+        _log_info(
+            "Command result: status=%s, exit_code=%s, stdout_len=%d",
+            result.status,
+            result.exit_code,
+            len(result.stdout),
+        )
+        return dump_command_result(result)
+
+    @mcp.tool()
+    async def execute_commands(commands: list[str], timeout: int = 30) -> list[dict[str, Any]]:
+        """Execute several shell commands in order in the persistent session.
+
+        The batch is pipelined through the shell in one burst, which is much
+        faster than separate execute_command calls for scripted workflows.
+
+        Args:
+            commands: Shell commands to execute, in order
+            timeout: Timeout in seconds per command (default: 30)
+        """
+        _log_info("execute_commands called with %d commands, timeout=%s", len(commands), timeout)
+
+        # Validate the whole batch before executing any of it
+        for command in commands:
+            try:
+                _validate_command(command)
+            except ValueError as e:
+                logger.warning("Command validation failed: %s", e)
+                return [
+                    {
+                        **ERR_TEMPLATE,
+                        "stderr": f"Security validation failed: {str(e)}",
+                        "command": command,
+                    }
+                ]
+
+        shell = await ensure_shell()
+        results = await shell.pipeline(commands, timeout=timeout)
+        return [dump_command_result(result) for result in results]
 
     @mcp.tool()
     async def get_working_directory() -> dict[str, Any]:
@@ -121,7 +178,7 @@ def create_app() -> FastAPI:
     async def reset_session() -> dict[str, Any]:
         """Reset the shell session to a clean state (equivalent to spawning a new shell)."""
         shell = await ensure_shell()
-        await shell.reset()
+        await shell.soft_reset()
         return {"status": "reset", "message": "Shell session has been reset to clean state"}
 
     @mcp.tool()
@@ -135,33 +192,52 @@ def create_app() -> FastAPI:
         """
         shell = await ensure_shell()
 
-        # We need the shell's cwd for relative paths
-        import base64
-        import os
-        from pathlib import Path
-
         try:
-            # Decode content
-            if encoding == "base64":
-                file_content = base64.b64decode(content)
-            else:
-                file_content = content.encode("utf-8")
-
-            # Get absolute path relative to workspace
-            cwd = await shell.get_cwd()
+            # The shell tracks its cwd on every command, so resolving a
+            # relative path is a plain attribute read with no PTY traffic
             if not path.startswith("/"):
-                abs_path = os.path.join(cwd, path)
+                abs_path = os.path.join(shell.working_dir, path)
             else:
                 abs_path = path
 
-            # Create parent directory if needed
-            Path(abs_path).parent.mkdir(parents=True, exist_ok=True)
-
-            # Write file
-            with open(abs_path, "wb") as f:
-                f.write(file_content)
-
-            size = len(file_content)
+            def _write() -> int:
+                """Decode and write in a thread (blocking I/O + CPU-bound decode)."""
+                # Create parent directory if needed
+                parent = os.path.dirname(abs_path)
+                if parent not in _known_dirs:
+                    os.makedirs(parent, exist_ok=True)
+                    _known_dirs.add(parent)
+
+                size = 0
+                try:
+                    f = open(abs_path, "wb")
+                except OSError:
+                    # Don't trust the cache after an open failure; the
+                    # directory may have been removed underneath us
+                    _known_dirs.discard(parent)
+                    raise
+                with f:
+                    if encoding == "base64":
+                        # base64 CLI output and encodebytes wrap lines; a
+                        # one-shot b64decode discards the newlines implicitly,
+                        # but windowed decoding needs them stripped up front
+                        # so every window stays a multiple of 4 data chars
+                        data = content.replace("\n", "").replace("\r", "")
+                        # Decode in 8KB windows (multiple of 4, so each window
+                        # is a valid base64 block) instead of materializing the
+                        # whole decoded payload in memory
+                        for i in range(0, len(data), 8192):
+                            chunk = base64.b64decode(data[i : i + 8192])
+                            f.write(chunk)
+                            size += len(chunk)
+                    else:
+                        file_content = content.encode("utf-8")
+                        f.write(file_content)
+                        size = len(file_content)
+
+                return size
+
+            size = await asyncio.to_thread(_write)
             return {"status": "uploaded", "path": abs_path, "size": size}
 
         except Exception as e:
@@ -177,28 +253,39 @@ def create_app() -> FastAPI:
         """
         shell = await ensure_shell()
 
-        import base64
-        import os
-
         try:
-            # Get absolute path relative to workspace
-            cwd = await shell.get_cwd()
+            # The shell tracks its cwd on every command, so resolving a
+            # relative path is a plain attribute read with no PTY traffic
             if not path.startswith("/"):
-                abs_path = os.path.join(cwd, path)
+                abs_path = os.path.join(shell.working_dir, path)
             else:
                 abs_path = path
 
-            # Read file
-            with open(abs_path, "rb") as f:
-                file_content = f.read()
-
-            # Encode content
-            if encoding == "base64":
-                content_str = base64.b64encode(file_content).decode("ascii")
-            else:
-                content_str = file_content.decode("utf-8")
-
-            size = len(file_content)
+            def _read() -> tuple[str, int]:
+                """Read and encode in a thread (blocking I/O + CPU-bound encode)."""
+                if encoding == "base64":
+                    # Encode in 48KB chunks (multiple of 3, so each chunk maps
+                    # to a clean base64 block) to keep peak memory at roughly
+                    # the encoded size instead of raw + encoded + str copies
+                    encoded = bytearray()
+                    size = 0
+                    with open(abs_path, "rb") as f:
+                        while chunk := f.read(49152):
+                            encoded += base64.b64encode(chunk)
+                            size += len(chunk)
+                    return encoded.decode("ascii"), size
+
+                # Size is known up front: read into a preallocated buffer
+                # instead of letting f.read() grow one geometrically
+                size = os.path.getsize(abs_path)
+                file_content = bytearray(size)
+                with open(abs_path, "rb") as f:
+                    n = f.readinto(file_content)
+                if n != size:
+                    del file_content[n:]
+                return file_content.decode("utf-8"), n
+
+            content_str, size = await asyncio.to_thread(_read)
             return {"content": content_str, "size": size, "encoding": encoding}
 
         except FileNotFoundError:
@@ -221,7 +308,7 @@ def create_app() -> FastAPI:
             # Initialize global shell
             await ensure_shell()
 
-            logger.info(f"Server ready on {config.server.host}:{config.server.port}")
+            logger.info("Server ready on %s:%s", config.server.host, config.server.port)
 
             yield
 
@@ -232,7 +319,13 @@ def create_app() -> FastAPI:
 
         await session_manager.shutdown()
 
-    app = FastAPI(title="MCP Persistent Shell", lifespan=lifespan)
+    # orjson serializes responses in C, which matters for command output that
+    # can legitimately run to max_output_size (1MB)
+    app = FastAPI(
+        title="MCP Persistent Shell",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+    )
 
     # Add health check endpoint BEFORE mounting MCP app
     @app.get("/health")
@@ -2,13 +2,21 @@
 
 import asyncio
 import logging
-import uuid
+import secrets
+from contextvars import ContextVar
 from typing import Optional
 
 from mcp_persistent_shell.config import SessionConfig, ShellConfig, SecurityConfig
 from mcp_persistent_shell.session.store import SessionStore
 from mcp_persistent_shell.shell.process import ShellProcess
 
+# Per-task cache of resolved sessions. Each MCP tool call runs in its own
+# asyncio task with its own context, so entries live for exactly one request
+# and a stale shell can never be served across requests.
+_session_cache: ContextVar[Optional[dict[str, ShellProcess]]] = ContextVar(
+    "session_cache", default=None
+)
+
 
 class SessionManager:
     """Manages shell session lifecycle and cleanup."""
@@ -35,8 +43,9 @@ class SessionManager:
                 f"Maximum sessions limit reached ({self.session_config.max_sessions})"
             )
 
-        # Generate cryptographically secure session ID
-        session_id = str(uuid.uuid4())
+        # Generate cryptographically secure session ID (plain hex; cheaper
+        # than building and stringifying a UUID object)
+        session_id = secrets.token_hex(16)
 
         # Create and start shell process
         shell = ShellProcess(
@@ -49,16 +58,29 @@ class SessionManager:
         # Store session
         await self.store.create(session_id, shell)
 
-        self.logger.info(f"Created session {session_id}")
+        self.logger.info("Created session %s", session_id)
         return session_id, shell
 
     async def get_session(self, session_id: str) -> Optional[ShellProcess]:
-        """Get shell process for session ID."""
+        """Get shell process for session ID.
+
+        Repeated lookups within one request hit the task-local cache instead
+        of going back through the store and its liveness probe.
+        """
+        cache = _session_cache.get()
+        if cache is None:
+            cache = {}
+            _session_cache.set(cache)
+        elif session_id in cache:
+            return cache[session_id]
+
         shell = await self.store.get(session_id)
         if shell and not shell.is_alive():
             # Clean up dead process
             await self.store.delete(session_id)
             return None
+        if shell:
+            cache[session_id] = shell
         return shell
 
     async def delete_session(self, session_id: str) -> bool:
@@ -91,24 +113,21 @@ class SessionManager:
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                self.logger.error(f"Error in cleanup task: {e}")
+                self.logger.error("Error in cleanup task: %s", e)
 
     async def _cleanup_expired_sessions(self) -> None:
         """Clean up sessions that have exceeded timeout."""
-        session_ids = await self.store.get_all_ids()
-
-        for session_id in session_ids:
-            shell = await self.store.get(session_id)
-            if shell:
-                idle_time = shell.idle_time()
-                if idle_time > self.session_config.timeout:
-                    self.logger.info(
-                        f"Cleaning up expired session {session_id} (idle: {idle_time:.0f}s)"
-                    )
-                    await self.store.delete(session_id)
-                elif not shell.is_alive():
-                    self.logger.info(f"Cleaning up dead session {session_id}")
-                    await self.store.delete(session_id)
+        # Single snapshot instead of a get() per session id
+        for session_id, shell in await self.store.snapshot():
+            idle_time = shell.idle_time()
+            if idle_time > self.session_config.timeout:
+                self.logger.info(
+                    "Cleaning up expired session %s (idle: %.0fs)", session_id, idle_time
+                )
+                await self.store.delete(session_id)
+            elif not shell.is_alive():
+                self.logger.info("Cleaning up dead session %s", session_id)
+                await self.store.delete(session_id)
 
     async def shutdown(self) -> None:
         """Shutdown all sessions and cleanup task."""
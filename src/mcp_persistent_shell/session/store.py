@@ -19,29 +19,35 @@ class SessionStore:
         """Store a new session."""
         async with self._lock:
             self._sessions[session_id] = shell_process
-            self.logger.info(f"Session created: {session_id}")
+            self.logger.info("Session created: %s", session_id)
 
     async def get(self, session_id: str) -> Optional[ShellProcess]:
-        """Retrieve shell process for a session."""
-        async with self._lock:
-            return self._sessions.get(session_id)
+        """Retrieve shell process for a session.
+
+        Single-key dict reads are atomic under the GIL, so no lock is needed.
+        """
+        return self._sessions.get(session_id)
 
     async def delete(self, session_id: str) -> bool:
         """Remove a session."""
         async with self._lock:
-            if session_id in self._sessions:
-                shell = self._sessions.pop(session_id)
-                await shell.terminate()
-                self.logger.info(f"Session deleted: {session_id}")
-                return True
+            shell = self._sessions.pop(session_id, None)
+        if shell is None:
             return False
+        # Terminate outside the lock so a slow shutdown doesn't block
+        # concurrent create/delete calls
+        await shell.terminate()
+        self.logger.info("Session deleted: %s", session_id)
+        return True
+
+    async def snapshot(self) -> list[tuple[str, ShellProcess]]:
+        """Get a point-in-time snapshot of all sessions (atomic, no lock needed)."""
+        return list(self._sessions.items())
 
     async def get_all_ids(self) -> list[str]:
-        """Get all session IDs."""
-        async with self._lock:
-            return list(self._sessions.keys())
+        """Get all session IDs (atomic snapshot, no lock needed)."""
+        return list(self._sessions)
 
     async def count(self) -> int:
-        """Get total session count."""
-        async with self._lock:
-            return len(self._sessions)
+        """Get total session count (atomic read, no lock needed)."""
+        return len(self._sessions)
@@ -1,18 +1,44 @@
-"""Shell process wrapper using pexpect for persistent shells."""
+"""Shell process wrapper using a native asyncio PTY for persistent shells."""
 
 import asyncio
 import logging
+import os
+import pty
+import re
+import termios
 import time
-from typing import Any
-
-import pexpect
 
 from mcp_persistent_shell.config import ShellConfig
 from mcp_persistent_shell.models import CommandResult
 
+# Record-separator control char framing the per-command sentinel; commands
+# never legitimately print it, so it's a safe delimiter. The tty input layer
+# eats raw \x1e bytes, so the shell side always produces it via the printf
+# octal escape _RS_OCT while we search the output for the literal _RS.
+_RS = "\x1e"
+_RS_OCT = "\\036"
+_RC_PREFIX = f"{_RS}RC=".encode()
+# How much to ask for per read(2) on the PTY master. A command producing MB of
+# output wakes the loop once per chunk, so large reads cut the syscall and
+# callback count ~16x versus the page-sized reads a naive loop would do
+_READ_SIZE = 65536
+
+# Sentinel block from an earlier (timed-out) command that surfaced late
+_STALE_SENTINEL = re.compile(f"{_RS}RC=[^{_RS}]*{_RS}CWD=[^{_RS}]*{_RS}END:\\d+{_RS}\\r?\\n?")
+# Compiled once so the hot parse path is a single C-level match against the
+# buffered bytes instead of a decode + split + prefix-compare loop per command
+_SENTINEL_META = re.compile(f"{_RS}RC=(-?\\d+){_RS}CWD=([^{_RS}]*){_RS}END:".encode())
+
 
 class ShellProcess:
-    """Wrapper for a persistent PTY shell process using pexpect."""
+    """Wrapper for a persistent PTY shell process driven by the event loop.
+
+    The master side of the PTY is registered with the running event loop via
+    add_reader, so output is drained as it arrives and commands await an
+    asyncio.Event instead of hopping to a worker thread and polling. Every
+    session's master fd shares the loop's selector this way, so concurrent
+    sessions — including ones sitting in long sleeps — cost no threads.
+    """
 
     def __init__(
         self,
@@ -23,107 +49,300 @@ class ShellProcess:
         self.shell_config = shell_config
         self.working_dir = working_dir
         self.logger = logger or logging.getLogger(__name__)
-        self.process: pexpect.spawn | None = None
-        self.last_activity = time.time()
-        self.prompt = f"{shell_config.prompt_marker}> "
+        self.process: asyncio.subprocess.Process | None = None
+        self.last_activity = time.monotonic()
+        self._master_fd: int | None = None
+        self._slave_path: str | None = None
+        self._seq = 0  # per-command sentinel sequence number
+        self._read_buf = bytearray()
+        # Reused for every read(2) so steady-state draining allocates nothing;
+        # only the valid prefix is copied into the accumulator
+        self._read_scratch = bytearray(_READ_SIZE)
+        # Ring of recent raw output for replay/attach. Overflow is drained
+        # from the front in one del, so the cost stays O(1) amortized per
+        # byte instead of O(N) per byte for a naive shift
+        self._scrollback = bytearray()
+        self._scrollback_cap = shell_config.scrollback_size
+        self._data_ready = asyncio.Event()
+        self._eof = False
 
     async def start(self) -> None:
-        """Spawn the shell process in a thread pool."""
+        """Spawn the shell attached to a PTY owned by the event loop."""
+        if not os.path.isdir(self.working_dir):
+            # The tracked directory can vanish underneath a running shell;
+            # start in the filesystem root rather than failing the spawn
+            self.logger.warning("Working directory %s is gone; starting in /", self.working_dir)
+            self.working_dir = "/"
         self.logger.info(
-            f"Starting shell process: {self.shell_config.default_shell} in {self.working_dir}"
+            "Starting shell process: %s in %s", self.shell_config.default_shell, self.working_dir
         )
 
-        def _spawn_shell() -> pexpect.spawn:
-            """Spawn shell in thread (pexpect is not async-safe)."""
-            proc = pexpect.spawn(
+        master_fd, slave_fd = pty.openpty()
+        # Kept so the slave can be reopened by path later; flushing the tty
+        # input queue is only possible from the slave side
+        self._slave_path = os.ttyname(slave_fd)
+
+        # Turn off echo on the slave side so the shell doesn't repeat every
+        # command back into the output stream
+        mode = termios.tcgetattr(slave_fd)
+        mode[3] &= ~termios.ECHO
+        termios.tcsetattr(slave_fd, termios.TCSANOW, mode)
+
+        try:
+            self.process = await asyncio.create_subprocess_exec(
                 self.shell_config.default_shell,
+                stdin=slave_fd,
+                stdout=slave_fd,
+                stderr=slave_fd,
                 cwd=self.working_dir,
-                timeout=30,
-                encoding="utf-8",
-                echo=False,
+                start_new_session=True,
+                # A dumb terminal keeps bash from emitting control sequences
+                # (bracketed paste etc.) into the captured output
+                env={**os.environ, "TERM": "dumb"},
             )
-
-            # Set custom prompt for reliable detection
-            proc.sendline(f'export PS1="{self.prompt}"')
-            proc.expect(self.prompt, timeout=5)
-
-            # Clear any initial output
-            proc.before = ""
-
-            return proc
-
-        self.process = await asyncio.to_thread(_spawn_shell)
-        self.last_activity = time.time()
+        finally:
+            os.close(slave_fd)
+
+        os.set_blocking(master_fd, False)
+        self._master_fd = master_fd
+        self._read_buf = bytearray()
+        self._data_ready = asyncio.Event()
+        self._eof = False
+        asyncio.get_running_loop().add_reader(master_fd, self._on_readable)
+
+        # An empty prompt keeps the output stream clean; command completion is
+        # detected via an explicit sentinel instead, so sync on one now
+        self._seq += 1
+        sync = f"PS1=''; PS2=''\nprintf '{_RS_OCT}END:{self._seq}{_RS_OCT}\\n'\n"
+        await self._write_all(sync.encode())
+        await self._expect(f"{_RS}END:{self._seq}{_RS}".encode(), timeout=5)
+
+        # Clear any initial output
+        self._read_buf.clear()
+
+        self.last_activity = time.monotonic()
         self.logger.info("Shell process started successfully")
 
+    def _on_readable(self) -> None:
+        """Drain available PTY output into the buffer (runs on the event loop)."""
+        assert self._master_fd is not None
+        try:
+            n = os.readv(self._master_fd, [self._read_scratch])
+        except BlockingIOError:
+            return
+        except OSError:
+            # PTY closed: treat like EOF
+            n = 0
+
+        if n:
+            data = memoryview(self._read_scratch)[:n]
+            self._read_buf += data
+            if self._scrollback_cap > 0:
+                self._push_scrollback(data)
+        else:
+            self._eof = True
+            asyncio.get_running_loop().remove_reader(self._master_fd)
+        self._data_ready.set()
+
+    async def _write_all(self, payload: bytes) -> None:
+        """Write payload to the PTY master, waiting out a full input queue.
+
+        The master is non-blocking and the tty input queue is small (~8KB),
+        so a single os.write silently truncates anything larger — partial
+        writes and BlockingIOError both mean "come back when the shell has
+        consumed some input". Output keeps draining through the reader
+        callback while we wait, so the shell can always make progress.
+        """
+        assert self._master_fd is not None
+        with memoryview(payload) as view:
+            sent = 0
+            while sent < len(payload):
+                try:
+                    n = os.write(self._master_fd, view[sent:])
+                except BlockingIOError:
+                    n = 0
+                sent += n
+                if sent < len(payload):
+                    await self._wait_writable()
+
+    def _flush_input_queue(self) -> None:
+        """Discard any input the shell hasn't read yet.
+
+        tcflush on the master only touches the master's own buffers; the
+        queued commands live on the slave side, so reopen the slave by path
+        and flush there. Best-effort — if the PTY is gone there's nothing
+        left to flush anyway.
+        """
+        if self._slave_path is None:
+            return
+        try:
+            fd = os.open(self._slave_path, os.O_RDWR | os.O_NOCTTY)
+        except OSError:
+            return
+        try:
+            termios.tcflush(fd, termios.TCIFLUSH)
+        finally:
+            os.close(fd)
+
+    async def _wait_writable(self) -> None:
+        """Suspend until the PTY master accepts more input."""
+        loop = asyncio.get_running_loop()
+        fd = self._master_fd
+        assert fd is not None
+        fut: asyncio.Future[None] = loop.create_future()
+
+        def _on_writable() -> None:
+            if not fut.done():
+                fut.set_result(None)
+
+        loop.add_writer(fd, _on_writable)
+        try:
+            await fut
+        finally:
+            loop.remove_writer(fd)
+
+    async def _expect(self, token: bytes, timeout: float) -> int:
+        """Wait until token appears in the buffer; return its offset.
+
+        Raises TimeoutError if the token doesn't show up in time and
+        EOFError if the shell exits first.
+        """
+        deadline = time.monotonic() + timeout
+        # Only the bytes that arrived since the last pass need searching;
+        # rescanning from the start of the buffer on every wakeup would make
+        # bulk-output commands quadratic in their output size. Back up by
+        # len(token) - 1 so a token split across two reads is still found.
+        scanned = 0
+        while True:
+            idx = self._read_buf.find(token, max(0, scanned - len(token) + 1))
+            if idx != -1:
+                return idx
+            scanned = len(self._read_buf)
+            if self._eof:
+                raise EOFError("Shell process terminated")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError
+            self._data_ready.clear()
+            try:
+                await asyncio.wait_for(self._data_ready.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                raise TimeoutError from None
+
+    def _wrap_command(self, command: str) -> tuple[bytes, bytes]:
+        """Tag a command with the rc/cwd sentinel; return (payload, end token).
+
+        The sentinel rides on the same output stream as the command, so one
+        round-trip delivers stdout, exit code, and the shell's cwd. The
+        sequence number makes the end token unique per command, which keeps a
+        late sentinel from a timed-out command from being mistaken for the
+        current one.
+        """
+        self._seq += 1
+        payload = (
+            f"{command}\n"
+            f"printf '{_RS_OCT}RC=%d{_RS_OCT}CWD=%s{_RS_OCT}END:{self._seq}{_RS_OCT}\\n'"
+            f" \"$?\" \"$PWD\"\n"
+        )
+        end_token = f"{_RS}END:{self._seq}{_RS}"
+        return payload.encode(), end_token.encode()
+
+    def _parse_sentinel(self, idx: int, end_len: int) -> tuple[str, int, str]:
+        """Split the buffer at the sentinel ending at idx.
+
+        Returns (output, exit_code, cwd) and removes the consumed region from
+        the buffer. The output comes back already whitespace-trimmed: the trim
+        happens on the raw bytes before decoding, so a multi-MB output is
+        copied once (buffer -> str) instead of once more by a later .strip().
+        """
+        start = self._read_buf.rfind(_RC_PREFIX, 0, idx)
+        if start == -1:
+            start = idx
+        lo, hi = 0, start
+        while hi > lo and self._read_buf[hi - 1] in b" \t\r\n":
+            hi -= 1
+        while lo < hi and self._read_buf[lo] in b" \t\r\n":
+            lo += 1
+        with memoryview(self._read_buf) as view:
+            output = str(view[lo:hi], "utf-8", "replace")
+        if _RS in output:
+            # Scrub sentinel blocks that a previously timed-out command left
+            # behind; its stdout residue is kept, matching prior behavior
+            output = _STALE_SENTINEL.sub("", output).strip()
+        exit_code = 0
+        cwd = self.working_dir
+        match = _SENTINEL_META.match(self._read_buf, start, idx + end_len)
+        if match:
+            exit_code = int(match.group(1))
+            # $PWD can come back empty when the shell sits in a deleted
+            # directory; keep the last known value rather than poisoning
+            # working_dir (a later hard reset spawns with it as cwd)
+            cwd = match.group(2).decode("utf-8", errors="replace") or self.working_dir
+        del self._read_buf[: idx + end_len]
+        return output, exit_code, cwd
+
+    def _push_scrollback(self, data: memoryview) -> None:
+        """Append raw output to the scrollback, draining overflow in front."""
+        cap = self._scrollback_cap
+        buf = self._scrollback
+        if len(data) >= cap:
+            buf.clear()
+            buf += data[len(data) - cap :]
+            return
+        overflow = len(buf) + len(data) - cap
+        if overflow > 0:
+            del buf[:overflow]
+        buf += data
+
+    def get_scrollback(self) -> bytes:
+        """Get up to scrollback_size bytes of the most recent raw output.
+
+        New arrivals are signalled via the same _data_ready event the command
+        loop uses, so a future attach/replay consumer can await it instead of
+        polling.
+        """
+        return bytes(self._scrollback)
+
+    def _consume_all(self) -> str:
+        """Take whatever partial output is buffered (timeout path)."""
+        output = self._read_buf.decode("utf-8", errors="replace")
+        self._read_buf.clear()
+        return output
+
     async def execute(
         self,
         command: str,
         timeout: int = 30,
     ) -> CommandResult:
         """Execute a command and return structured result."""
-        if not self.process or not self.process.isalive():
+        if not self.is_alive() or self._master_fd is None:
             raise RuntimeError("Shell process is not running")
 
-        start_time = time.time()
-        self.logger.debug(f"Executing command: {command}")
-
-        def _execute_command() -> tuple[str, str, int]:
-            """Execute command in thread (pexpect is not async-safe)."""
-            if not self.process:
-                raise RuntimeError("Shell process not initialized")
-
-            # Send command
-            self.process.sendline(command)
-
-            try:
-                # Wait for prompt to return
-                self.process.expect(self.prompt, timeout=timeout)
-
-                # Capture output (everything before the prompt)
-                output = self.process.before or ""
-
-                # Get exit code by running echo $?
-                self.process.sendline("echo $?")
-                self.process.expect(self.prompt, timeout=5)
-                exit_code_str = (self.process.before or "").strip()
-
-                try:
-                    exit_code = int(exit_code_str)
-                except ValueError:
-                    exit_code = 0  # Assume success if we can't parse
-
-                return output, "", exit_code
-
-            except pexpect.TIMEOUT:
-                self.logger.warning(f"Command timed out after {timeout}s: {command}")
-                # Try to get any partial output
-                output = self.process.before or ""
-                return output, f"Command timed out after {timeout}s", -1
-
-            except pexpect.EOF:
-                self.logger.error("Shell process terminated unexpectedly")
-                return "", "Shell process terminated", -1
+        # perf_counter_ns for the interval: immune to NTP steps that could
+        # make a wall-clock delta go negative
+        start_ns = time.perf_counter_ns()
+        # Lazy %-formatting: the message is only built if DEBUG is enabled
+        self.logger.debug("Executing command: %s", command)
 
         try:
-            stdout, stderr, exit_code = await asyncio.to_thread(_execute_command)
-            execution_time = time.time() - start_time
-            self.last_activity = time.time()
+            stdout, stderr, exit_code = await self._run_command(command, timeout)
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+            self.last_activity = time.monotonic()
 
             status = "success" if exit_code == 0 else "error"
 
             return CommandResult(
                 status=status,
                 exit_code=exit_code,
-                stdout=stdout.strip(),
+                stdout=stdout,
                 stderr=stderr,
                 command=command,
                 execution_time=execution_time,
             )
 
         except Exception as e:
-            self.logger.error(f"Error executing command: {e}")
-            execution_time = time.time() - start_time
+            self.logger.error("Error executing command: %s", e)
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
             return CommandResult(
                 status="error",
                 exit_code=-1,
@@ -133,11 +352,166 @@ class ShellProcess:
                 execution_time=execution_time,
             )
 
+    async def _run_command(self, command: str, timeout: int) -> tuple[str, str, int]:
+        """Send one command and collect its output, exit code, and cwd."""
+        assert self._master_fd is not None
+
+        # Send command and sentinel together; the exit code and cwd ride on
+        # the same round-trip instead of a second echo $? exchange. The write
+        # shares the command's timeout so a shell that stopped reading can't
+        # hang us here.
+        payload, end_token = self._wrap_command(command)
+
+        try:
+            await asyncio.wait_for(self._write_all(payload), timeout)
+            idx = await self._expect(end_token, timeout)
+        except (TimeoutError, asyncio.TimeoutError):
+            self.logger.warning("Command timed out after %ss: %s", timeout, command)
+            # Return any partial output
+            return self._consume_all().strip(), f"Command timed out after {timeout}s", -1
+        except EOFError:
+            self.logger.error("Shell process terminated unexpectedly")
+            return "", "Shell process terminated", -1
+
+        output, exit_code, cwd = self._parse_sentinel(idx, len(end_token))
+        # Track the shell's cwd opportunistically so get_cwd (and the file
+        # tools resolving relative paths) don't need a PTY round-trip
+        self.working_dir = cwd
+        return output, "", exit_code
+
+    async def pipeline(self, commands: list[str], timeout: int = 30) -> list[CommandResult]:
+        """Execute a batch of commands, amortizing PTY round-trips.
+
+        All commands are written to the shell in a single burst, each tagged
+        with an exit-code marker, and the outputs are then demultiplexed in
+        order by prompt.
+        """
+        if not self.is_alive() or self._master_fd is None:
+            raise RuntimeError("Shell process is not running")
+
+        # The batch is fed by a background task so the shell consumes the
+        # commands back-to-back without a round-trip between them. A large
+        # batch doesn't fit the ~8KB tty input queue in one write, so the
+        # feeder drains through _write_all while we demultiplex results —
+        # the shell reading commands is exactly what frees queue space.
+        wrapped = [self._wrap_command(command) for command in commands]
+        batch = b"".join(payload for payload, _ in wrapped)
+        feeder = asyncio.ensure_future(self._write_all(batch))
+
+        results: list[CommandResult] = []
+        failed = False
+        try:
+            for command, (_, end_token) in zip(commands, wrapped):
+                if failed:
+                    # The PTY stream is no longer in a known state; don't try
+                    # to attribute any remaining output to later commands
+                    results.append(
+                        CommandResult(
+                            status="error",
+                            exit_code=-1,
+                            stdout="",
+                            stderr="Skipped: earlier command in batch did not complete",
+                            command=command,
+                            execution_time=0.0,
+                        )
+                    )
+                    continue
+
+                start_ns = time.perf_counter_ns()
+                try:
+                    idx = await self._expect(end_token, timeout)
+                except TimeoutError:
+                    self.logger.warning(
+                        "Batched command timed out after %ss: %s", timeout, command
+                    )
+                    # Stop feeding first, then flush what's already queued:
+                    # the rest of the batch would otherwise still execute once
+                    # the stuck command finishes, making the "Skipped" results
+                    # below a lie (and inviting double execution on retry).
+                    # The flush also makes room in a full input queue, so the
+                    # VINTR that interrupts the stuck foreground command is
+                    # guaranteed to fit.
+                    feeder.cancel()
+                    self._flush_input_queue()
+                    try:
+                        os.write(self._master_fd, b"\x03")
+                    except OSError:
+                        pass
+                    results.append(
+                        CommandResult(
+                            status="error",
+                            exit_code=-1,
+                            stdout=self._consume_all().strip(),
+                            stderr=f"Command timed out after {timeout}s",
+                            command=command,
+                            execution_time=(time.perf_counter_ns() - start_ns) / 1e9,
+                        )
+                    )
+                    failed = True
+                    continue
+                except EOFError:
+                    self.logger.error("Shell process terminated unexpectedly")
+                    results.append(
+                        CommandResult(
+                            status="error",
+                            exit_code=-1,
+                            stdout="",
+                            stderr="Shell process terminated",
+                            command=command,
+                            execution_time=(time.perf_counter_ns() - start_ns) / 1e9,
+                        )
+                    )
+                    failed = True
+                    continue
+
+                output, exit_code, cwd = self._parse_sentinel(idx, len(end_token))
+                self.working_dir = cwd
+
+                results.append(
+                    CommandResult(
+                        status="success" if exit_code == 0 else "error",
+                        exit_code=exit_code,
+                        stdout=output,
+                        stderr="",
+                        command=command,
+                        execution_time=(time.perf_counter_ns() - start_ns) / 1e9,
+                    )
+                )
+        finally:
+            # The feeder normally finishes long before the last result; make
+            # sure it never outlives the batch (cancelled on timeout above,
+            # or left running if we unwind early).
+            if not feeder.done():
+                feeder.cancel()
+            try:
+                await feeder
+            except (asyncio.CancelledError, EOFError, OSError):
+                pass
+
+        self.last_activity = time.monotonic()
+        return results
+
     async def get_cwd(self) -> str:
-        """Get the current working directory."""
-        result = await self.execute("pwd", timeout=5)
-        if result.status == "success":
-            return result.stdout.strip()
+        """Get the current working directory.
+
+        On Linux the kernel's own view of the child's cwd is one readlink
+        away in /proc — no PTY traffic, and authoritative even if something
+        changed directory without going through execute(). Elsewhere (or if
+        the process is gone) this falls back to the value tracked from every
+        command's sentinel. Kept async for API compatibility.
+        """
+        if self.process is not None:
+            try:
+                cwd = os.readlink(f"/proc/{self.process.pid}/cwd")
+            except OSError:
+                return self.working_dir
+            if cwd.endswith(" (deleted)"):
+                # The shell is sitting in a directory that was removed; the
+                # readlink result is a display string, not a usable path, so
+                # keep reporting the last real one rather than caching it
+                return self.working_dir
+            self.working_dir = cwd
+            return cwd
         return self.working_dir
 
     async def reset(self) -> None:
@@ -146,29 +520,96 @@ class ShellProcess:
         await self.terminate()
         await self.start()
 
+    async def soft_reset(self) -> None:
+        """Reset shell state by exec'ing a fresh shell inside the existing PTY.
+
+        Replacing the shell image in place skips the fork and rc-file cost of
+        a full terminate/start cycle and keeps the PTY fds (and their reader
+        registration) intact. HOME and PATH carry over; everything else is
+        cleared, matching the environment a freshly started shell would get.
+        Falls back to a hard reset if the shell is gone or the exec fails.
+        """
+        if not self.is_alive() or self._master_fd is None:
+            await self.reset()
+            return
+
+        self.logger.info("Soft-resetting shell process")
+        self._read_buf.clear()
+        # The cd sits on its own line so a working directory that vanished
+        # can't short-circuit the exec and leave the old environment alive.
+        # The exported marker proves the exec took: env -i wipes it, so if
+        # the sync still sees it the old shell survived (interactive bash
+        # doesn't exit on a failed exec) and we restart the hard way.
+        exec_line = (
+            f"export __MCP_RESET_CHECK=stale\n"
+            f"cd '{self.working_dir}' 2>/dev/null\n"
+            f'exec env -i TERM=dumb HOME="$HOME" PATH="$PATH" '
+            f"{self.shell_config.default_shell}\n"
+        )
+        # The fresh image comes up with a default prompt; silence it and sync
+        # on a sentinel exactly like start() does. Bash reads input line by
+        # line, so the sync lines sit in the PTY buffer until the new shell
+        # picks them up.
+        self._seq += 1
+        sync = (
+            f"PS1=''; PS2=''\n"
+            f"printf '{_RS_OCT}RESET=%s{_RS_OCT}END:{self._seq}{_RS_OCT}\\n'"
+            f' "$__MCP_RESET_CHECK"\n'
+        )
+        try:
+            await asyncio.wait_for(self._write_all(exec_line.encode() + sync.encode()), 5)
+            await self._expect(f"{_RS}END:{self._seq}{_RS}".encode(), timeout=5)
+        except (TimeoutError, asyncio.TimeoutError, EOFError):
+            # exec didn't take (shell died mid-reset); restart
+            await self.reset()
+            return
+
+        stale = b"RESET=stale" in self._read_buf
+        self._read_buf.clear()
+        if stale:
+            # The old shell answered the sync: exec never happened
+            await self.reset()
+            return
+        self.last_activity = time.monotonic()
+
     async def terminate(self) -> None:
         """Terminate the shell process gracefully."""
-        if self.process and self.process.isalive():
+        if self.process and self.process.returncode is None:
             self.logger.info("Terminating shell process")
-
-            def _terminate() -> None:
-                if self.process:
-                    try:
-                        self.process.sendline("exit")
-                        self.process.expect(pexpect.EOF, timeout=5)
-                    except:
-                        pass
-                    finally:
-                        if self.process.isalive():
-                            self.process.terminate(force=True)
-
-            await asyncio.to_thread(_terminate)
-            self.process = None
+            try:
+                if self._master_fd is not None:
+                    os.write(self._master_fd, b"exit\n")
+                await asyncio.wait_for(self.process.wait(), timeout=5)
+            except (asyncio.TimeoutError, OSError):
+                self.process.kill()
+                await self.process.wait()
+
+        self._close_master()
+        self.process = None
+
+    def _close_master(self) -> None:
+        """Unregister and close the master PTY fd."""
+        if self._master_fd is None:
+            return
+        if not self._eof:
+            try:
+                asyncio.get_running_loop().remove_reader(self._master_fd)
+            except RuntimeError:
+                pass
+        try:
+            os.close(self._master_fd)
+        except OSError:
+            pass
+        self._master_fd = None
 
     def is_alive(self) -> bool:
-        """Check if the shell process is still alive."""
-        return self.process is not None and self.process.isalive()
+        """Check if the shell process is still alive.
+
+        Plain attribute read — asyncio's child watcher keeps returncode
+        current, so there's no waitpid and no executor hop per call.
+        """
+        return self.process is not None and self.process.returncode is None
 
     def idle_time(self) -> float:
-        """Get the idle time in seconds."""
-        return time.time() - self.last_activity
+        """Get the idle time in seconds (plain attribute read, never blocks)."""
+        return time.monotonic() - self.last_activity
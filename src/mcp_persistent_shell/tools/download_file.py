@@ -1,43 +1,82 @@
 """Download file MCP tool handler."""
 
+import asyncio
 import base64
 import os
 from typing import Any
 
+from mcp import types
+
 from mcp_persistent_shell.session.manager import SessionManager
 
+# Files above this size are base64-encoded chunk by chunk, keeping peak memory
+# near the encoded size instead of raw + encoded + str copies side by side;
+# smaller files keep the simple one-shot path
+_STREAM_THRESHOLD = 1048576  # 1MB
+_ENCODE_CHUNK = 49152  # multiple of 3, so each chunk maps to a clean base64 block
+
+# With encoding="binary", files above this size are returned as an MCP blob
+# resource instead of a field in the JSON result, sparing the transport a
+# JSON-escape pass over the payload; smaller files keep the legacy shape so
+# simple clients don't need resource handling for a config file
+_RESOURCE_THRESHOLD = 262144  # 256KB
+
 
 async def handle_download_file(
     session_id: str,
     file_path: str,
     encoding: str,
     session_manager: SessionManager,
-) -> dict[str, Any]:
-    """Handle download_file tool call."""
+) -> dict[str, Any] | list[types.BlobResourceContents]:
+    """Handle download_file tool call.
+
+    encoding is "base64" or "utf8" for the classic JSON result shape, or
+    "binary" to get large files back as an MCP blob resource.
+    """
     shell = await session_manager.get_session(session_id)
     if not shell:
         return {"error": "Session not found or expired"}
 
     try:
-        # Get absolute path relative to workspace
-        cwd = await shell.get_cwd()
+        # Get absolute path relative to workspace; the shell tracks its cwd on
+        # every command, so this is a plain attribute read with no PTY traffic
         if not file_path.startswith("/"):
-            abs_path = os.path.join(cwd, file_path)
+            abs_path = os.path.join(shell.working_dir, file_path)
         else:
             abs_path = file_path
 
-        # Read file
-        with open(abs_path, "rb") as f:
-            file_content = f.read()
+        def _read() -> tuple[str, int]:
+            """Read and encode in a thread (blocking I/O + CPU-bound encode)."""
+            size = os.path.getsize(abs_path)
+            if encoding != "utf8" and size > _STREAM_THRESHOLD:
+                # Stream the encode so the raw file never sits fully in memory
+                encoded = bytearray()
+                with open(abs_path, "rb") as f:
+                    while chunk := f.read(_ENCODE_CHUNK):
+                        encoded += base64.b64encode(chunk)
+                return encoded.decode("ascii"), size
 
-        # Encode content
-        if encoding == "base64":
-            content = base64.b64encode(file_content).decode("ascii")
-        else:
-            content = file_content.decode("utf-8")
+            # The size is known up front, so read into a preallocated buffer;
+            # f.read() would grow its buffer geometrically, recopying the data
+            # O(log N) times along the way
+            file_content = bytearray(size)
+            with open(abs_path, "rb") as f:
+                n = f.readinto(file_content)
+            if n != size:
+                # File shrank between stat and read; drop the unfilled tail
+                del file_content[n:]
+            if encoding == "utf8":
+                return file_content.decode("utf-8"), n
+            return base64.b64encode(file_content).decode("ascii"), n
 
-        size = len(file_content)
-        return {"content": content, "size": size, "encoding": encoding}
+        content, size = await asyncio.to_thread(_read)
+        if encoding == "binary" and size > _RESOURCE_THRESHOLD:
+            return [types.BlobResourceContents(uri=f"file://{abs_path}", blob=content)]
+        return {
+            "content": content,
+            "size": size,
+            "encoding": "base64" if encoding == "binary" else encoding,
+        }
 
     except FileNotFoundError:
         return {"error": f"File not found: {file_path}"}
@@ -3,10 +3,21 @@
 import logging
 from typing import Any
 
-from mcp_persistent_shell.models import CommandResult
+from mcp_persistent_shell.models import dump_command_result
 from mcp_persistent_shell.security.validator import SecurityValidator
 from mcp_persistent_shell.session.manager import SessionManager
 
+# Shared shape for every error return: a single dict-copy per failure, and one
+# place that keeps the fields in lockstep with CommandResult
+ERR_TEMPLATE: dict[str, Any] = {
+    "status": "error",
+    "exit_code": -1,
+    "stdout": "",
+    "stderr": "",
+    "command": "",
+    "execution_time": 0.0,
+}
+
 
 async def handle_execute_command(
     session_id: str,
@@ -21,28 +32,22 @@ async def handle_execute_command(
     try:
         security_validator.validate_command(command)
     except ValueError as e:
-        logger.warning(f"Command validation failed: {e}")
+        logger.warning("Command validation failed: %s", e)
         return {
-            "status": "error",
-            "exit_code": -1,
-            "stdout": "",
+            **ERR_TEMPLATE,
             "stderr": f"Security validation failed: {str(e)}",
             "command": command,
-            "execution_time": 0.0,
         }
 
     # Get shell process
     shell = await session_manager.get_session(session_id)
     if not shell:
         return {
-            "status": "error",
-            "exit_code": -1,
-            "stdout": "",
+            **ERR_TEMPLATE,
             "stderr": "Session not found or expired",
             "command": command,
-            "execution_time": 0.0,
         }
 
     # Execute command
     result = await shell.execute(command, timeout=timeout)
-    return result.model_dump()
+    return dump_command_result(result)
@@ -11,5 +11,5 @@ async def handle_reset_session(session_id: str, session_manager: SessionManager)
     if not shell:
         return {"error": "Session not found or expired"}
 
-    await shell.reset()
+    await shell.soft_reset()
     return {"status": "reset", "message": "Shell session has been reset to clean state"}
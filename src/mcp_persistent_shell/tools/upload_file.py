@@ -1,5 +1,6 @@
 """Upload file MCP tool handler."""
 
+import asyncio
 import base64
 import os
 from pathlib import Path
@@ -7,6 +8,12 @@ from typing import Any
 
 from mcp_persistent_shell.session.manager import SessionManager
 
+# Payloads above this size are base64-decoded window by window straight into
+# the file, so the decoded bytes never sit fully in memory; smaller payloads
+# keep the simple one-shot path
+_STREAM_THRESHOLD = 1048576  # 1MB
+_DECODE_WINDOW = 65536  # multiple of 4, so each window is a valid base64 block
+
 
 async def handle_upload_file(
     session_id: str,
@@ -21,27 +28,42 @@ async def handle_upload_file(
         return {"error": "Session not found or expired"}
 
     try:
-        # Decode content
-        if encoding == "base64":
-            file_content = base64.b64decode(content)
-        else:
-            file_content = content.encode("utf-8")
-
-        # Get absolute path relative to workspace
-        cwd = await shell.get_cwd()
+        # Get absolute path relative to workspace; the shell tracks its cwd on
+        # every command, so this is a plain attribute read with no PTY traffic
         if not file_path.startswith("/"):
-            abs_path = os.path.join(cwd, file_path)
+            abs_path = os.path.join(shell.working_dir, file_path)
         else:
             abs_path = file_path
 
-        # Create parent directory if needed
-        Path(abs_path).parent.mkdir(parents=True, exist_ok=True)
+        def _write() -> int:
+            """Decode and write in a thread (blocking I/O + CPU-bound decode)."""
+            # Create parent directory if needed
+            Path(abs_path).parent.mkdir(parents=True, exist_ok=True)
 
-        # Write file
-        with open(abs_path, "wb") as f:
-            f.write(file_content)
+            size = 0
+            # buffering=0 skips the BufferedWriter's copy into its own
+            # buffer; each write goes to the kernel in a single write(2)
+            with open(abs_path, "wb", buffering=0) as f:
+                if encoding == "base64" and len(content) > _STREAM_THRESHOLD:
+                    # base64 CLI output and encodebytes wrap lines; a one-shot
+                    # b64decode discards the newlines implicitly, but windowed
+                    # decoding needs them stripped up front so every window
+                    # stays a multiple of 4 data chars
+                    data = content.replace("\n", "").replace("\r", "")
+                    for i in range(0, len(data), _DECODE_WINDOW):
+                        chunk = base64.b64decode(data[i : i + _DECODE_WINDOW])
+                        f.write(chunk)
+                        size += len(chunk)
+                else:
+                    if encoding == "base64":
+                        file_content = base64.b64decode(content)
+                    else:
+                        file_content = content.encode("utf-8")
+                    f.write(file_content)
+                    size = len(file_content)
+            return size
 
-        size = len(file_content)
+        size = await asyncio.to_thread(_write)
         return {"status": "uploaded", "path": abs_path, "size": size}
 
     except Exception as e:
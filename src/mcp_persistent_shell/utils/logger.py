@@ -6,6 +6,37 @@ from typing import Any
 
 from mcp_persistent_shell.config import LoggingConfig
 
+try:
+    import orjson
+
+    def _dumps(obj: dict[str, Any]) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    import json
+
+    def _dumps(obj: dict[str, Any]) -> str:
+        return json.dumps(obj)
+
+
+class OrjsonFormatter(logging.Formatter):
+    """JSON log formatter backed by orjson (stdlib json if unavailable).
+
+    Serializing the record as an actual dict escapes quotes and newlines in
+    messages correctly — the old %-style format string fabricated JSON by
+    interpolation and broke on command output containing either.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        return _dumps(
+            {
+                "timestamp": self.formatTime(record),
+                "level": record.levelname,
+                "logger": record.name,
+                "message": record.getMessage(),
+            }
+        )
+
 
 def setup_logging(config: LoggingConfig) -> logging.Logger:
     """Setup structured logging based on configuration."""
@@ -20,17 +51,16 @@ def setup_logging(config: LoggingConfig) -> logging.Logger:
 
     log_level = level_map.get(config.level.lower(), logging.INFO)
 
+    handler = logging.StreamHandler(sys.stdout)
+    if config.format == "json":
+        handler.setFormatter(OrjsonFormatter())
+    else:
+        handler.setFormatter(
+            logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+        )
+
     # Configure root logger
-    logging.basicConfig(
-        level=log_level,
-        format=(
-            '{"timestamp": "%(asctime)s", "level": "%(levelname)s", '
-            '"logger": "%(name)s", "message": "%(message)s"}'
-            if config.format == "json"
-            else "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        ),
-        handlers=[logging.StreamHandler(sys.stdout)],
-    )
+    logging.basicConfig(level=log_level, handlers=[handler])
 
     logger = logging.getLogger("mcp_persistent_shell")
     logger.setLevel(log_level)